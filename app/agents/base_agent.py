@@ -5,10 +5,12 @@ import json
 import logging
 import re
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.exceptions import OutputParserException
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.runnables import Runnable
 
 from app.config import settings
 from app.providers import get_langchain_llm, ProviderType
@@ -16,6 +18,61 @@ from app.providers import get_langchain_llm, ProviderType
 logger = logging.getLogger(__name__)
 
 
+def _structured_output_errors() -> tuple:
+    """
+    Exceptions that mean the model's structured reply was malformed.
+    
+    Besides local parse failures, providers that validate tool calls reject
+    a malformed one as a bad request (e.g. Groq's ``tool_use_failed``).
+    """
+    errors: List[type] = [OutputParserException]
+    try:
+        import openai
+        errors.append(openai.BadRequestError)
+    except ImportError:
+        pass
+    try:
+        import groq
+        errors.append(groq.BadRequestError)
+    except ImportError:
+        pass
+    try:
+        from langchain_google_genai.chat_models import ChatGoogleGenerativeAIError
+        errors.append(ChatGoogleGenerativeAIError)
+    except ImportError:
+        pass
+    return tuple(errors)
+
+
+STRUCTURED_OUTPUT_ERRORS = _structured_output_errors()
+
+
+def invoke_structured(llm: Runnable, messages: List[BaseMessage]) -> str:
+    """
+    Invoke a structured-output model and return its result as JSON text.
+    
+    A reply that does not parse against the schema, or that the provider
+    rejects as a malformed tool call, is returned as "", so callers fall back
+    to their default response as they do for bad JSON.
+    """
+    try:
+        result = llm.invoke(messages)
+    except STRUCTURED_OUTPUT_ERRORS as e:
+        logger.warning(f"Structured output could not be parsed: {e}")
+        return ""
+    return json.dumps(result, ensure_ascii=False) if result is not None else ""
+
+
+async def ainvoke_structured(llm: Runnable, messages: List[BaseMessage]) -> str:
+    """Async version of invoke_structured."""
+    try:
+        result = await llm.ainvoke(messages)
+    except STRUCTURED_OUTPUT_ERRORS as e:
+        logger.warning(f"Structured output could not be parsed: {e}")
+        return ""
+    return json.dumps(result, ensure_ascii=False) if result is not None else ""
+
+
 class BaseInterviewAgent(ABC):
     """Base class for all interview agents."""
     
@@ -27,7 +84,7 @@ class BaseInterviewAgent(ABC):
         provider: Optional[Union[str, ProviderType]] = None,
     ):
         """
-        Initialize the agent with an LLM.
+        Initialize the agent. The LLM is created on first use.
         
         Args:
             model: Model name to use. If None, uses provider default
@@ -35,20 +92,66 @@ class BaseInterviewAgent(ABC):
             llm: Optional pre-configured LangChain LLM
             provider: LLM provider ("openai", "gemini", "groq"). If None, uses settings
         """
-        if llm:
-            self.llm = llm
-        else:
-            self.llm = get_langchain_llm(
-                provider_type=provider,
-                model=model,
-                temperature=temperature,
+        self._llm = llm
+        self._model = model
+        self._temperature = temperature
+        self._provider = provider
+        self._structured_llm: Optional[Runnable] = None
+    
+    @property
+    def llm(self) -> BaseChatModel:
+        """Lazy load the LLM, so an agent can map requests and parse responses without one."""
+        if self._llm is None:
+            self._llm = get_langchain_llm(
+                provider_type=self._provider,
+                model=self._model,
+                temperature=self._temperature,
             )
+        return self._llm
     
     @abstractmethod
     def get_prompt_template(self) -> str:
         """Return the prompt template for this agent."""
         pass
     
+    def get_system_prompt(self, **kwargs: Any) -> Optional[str]:
+        """
+        Return the system prompt for this agent, if any.
+        
+        Keeping request-independent instructions in the system message lets
+        providers reuse it as a cached prompt prefix. The invocation's template
+        variables are passed for prompts specialized per request. Override in
+        subclasses.
+        """
+        return None
+    
+    def get_output_schema(self) -> Optional[Dict[str, Any]]:
+        """
+        Return a JSON schema for the response, if any.
+        
+        When set, the schema is sent as the provider's structured-output format
+        instead of being described in the prompt. Override in subclasses.
+        """
+        return None
+    
+    @property
+    def structured_llm(self) -> Optional[Runnable]:
+        """Lazy bind the output schema to the LLM."""
+        if self._structured_llm is None:
+            schema = self.get_output_schema()
+            if schema is not None:
+                self._structured_llm = self.llm.with_structured_output(schema)
+        return self._structured_llm
+    
+    def build_messages(self, **kwargs: Any) -> List[BaseMessage]:
+        """Build the chat messages for a single invocation."""
+        messages: List[BaseMessage] = []
+        system_prompt = self.get_system_prompt(**kwargs)
+        if system_prompt:
+            messages.append(SystemMessage(content=system_prompt))
+        messages.append(HumanMessage(content=self.format_prompt(**kwargs)))
+        return messages
+    
     def format_prompt(self, **kwargs: Any) -> str:
         """Format the prompt template with provided values."""
         template = self.get_prompt_template()
@@ -60,10 +163,11 @@ class BaseInterviewAgent(ABC):
     
     async def invoke(self, **kwargs: Any) -> str:
         """Invoke the agent and return the raw response."""
-        prompt = self.format_prompt(**kwargs)
-        messages = [HumanMessage(content=prompt)]
+        messages = self.build_messages(**kwargs)
         
         try:
+            if self.structured_llm is not None:
+                return await ainvoke_structured(self.structured_llm, messages)
             response = await self.llm.ainvoke(messages)
             return response.content
         except Exception as e:
@@ -72,10 +176,11 @@ class BaseInterviewAgent(ABC):
     
     def invoke_sync(self, **kwargs: Any) -> str:
         """Synchronous invoke for the agent."""
-        prompt = self.format_prompt(**kwargs)
-        messages = [HumanMessage(content=prompt)]
+        messages = self.build_messages(**kwargs)
         
         try:
+            if self.structured_llm is not None:
+                return invoke_structured(self.structured_llm, messages)
             response = self.llm.invoke(messages)
             return response.content
         except Exception as e:
@@ -8,10 +8,12 @@ based on user topic, level, and learning goals.
 import json
 import re
 from typing import Optional
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import convert_to_messages
 
 from app.providers import get_langchain_llm
-from app.agents.recommender_prompts import COURSE_RECOMMENDER_PROMPT
+from app.agents.base_agent import ainvoke_structured, invoke_structured
+from app.agents.recommender_prompts import build_course_messages, get_output_schema
+from app.agents.semantic_cache import acached_generate, cached_generate
 from app.models.recommender_schemas import (
     CourseRecommendation,
     CourseMatch,
@@ -25,7 +27,23 @@ class CourseRecommenderAgent:
     
     def __init__(self, provider_type: str = None):
         """Initialize the course recommender agent."""
-        self.llm = get_langchain_llm(provider_type=provider_type)
+        self.provider_type = provider_type
+        self._llm = None
+        self._structured_llm = None
+    
+    @property
+    def llm(self):
+        """Lazy load the LLM, so the agent can map requests and parse responses without one."""
+        if self._llm is None:
+            self._llm = get_langchain_llm(provider_type=self.provider_type)
+        return self._llm
+    
+    @property
+    def structured_llm(self):
+        """Lazy bind the response schema to the LLM."""
+        if self._structured_llm is None:
+            self._structured_llm = self.llm.with_structured_output(get_output_schema("course"))
+        return self._structured_llm
     
     async def recommend(self, request: CourseRequest) -> CourseRecommendation:
         """
@@ -37,26 +55,16 @@ class CourseRecommenderAgent:
         Returns:
             CourseRecommendation with courses and certifications
         """
-        # Build the prompt
-        prompt = COURSE_RECOMMENDER_PROMPT.format(
-            topic=request.topic,
-            current_level=request.current_level or "beginner",
-            learning_goal=request.learning_goal or "gain proficiency",
-            time_available=request.time_available or "flexible",
-            budget=request.budget or "flexible",
-            prefer_certificates=request.prefer_certificates
-        )
+        variables = self.prompt_variables(request)
         
-        messages = [
-            SystemMessage(content="You are an expert learning advisor. Return only valid JSON."),
-            HumanMessage(content=prompt)
-        ]
+        async def generate() -> str:
+            return await ainvoke_structured(self.structured_llm, self._build_messages(variables))
         
-        # Get LLM response
-        response = await self.llm.ainvoke(messages)
+        # Get LLM response (served from the semantic cache when possible)
+        content = await acached_generate("course", variables, generate)
         
         # Parse and build recommendation
-        return self._build_recommendation(response.content, request)
+        return self.parse_response(content, request)
     
     def recommend_sync(self, request: CourseRequest) -> CourseRecommendation:
         """
@@ -68,28 +76,35 @@ class CourseRecommenderAgent:
         Returns:
             CourseRecommendation with courses and certifications
         """
-        # Build the prompt
-        prompt = COURSE_RECOMMENDER_PROMPT.format(
-            topic=request.topic,
-            current_level=request.current_level or "beginner",
-            learning_goal=request.learning_goal or "gain proficiency",
-            time_available=request.time_available or "flexible",
-            budget=request.budget or "flexible",
-            prefer_certificates=request.prefer_certificates
-        )
+        variables = self.prompt_variables(request)
         
-        messages = [
-            SystemMessage(content="You are an expert learning advisor. Return only valid JSON."),
-            HumanMessage(content=prompt)
-        ]
+        def generate() -> str:
+            return invoke_structured(self.structured_llm, self._build_messages(variables))
         
-        # Get LLM response
-        response = self.llm.invoke(messages)
+        # Get LLM response (served from the semantic cache when possible)
+        content = cached_generate("course", variables, generate)
         
         # Parse and build recommendation
-        return self._build_recommendation(response.content, request)
+        return self.parse_response(content, request)
+    
+    def prompt_variables(self, request: CourseRequest) -> dict:
+        """Map the request onto the prompt template variables."""
+        return {
+            "topic": request.topic,
+            "current_level": request.current_level or "beginner",
+            "learning_goal": request.learning_goal or "gain proficiency",
+            "time_available": request.time_available or "flexible",
+            "budget": request.budget or "flexible",
+            "prefer_certificates": request.prefer_certificates,
+        }
+    
+    def _build_messages(self, variables: dict) -> list:
+        """Build the chat messages: static system prompt + rendered request tail."""
+        return convert_to_messages(
+            build_course_messages(**variables)
+        )
     
-    def _build_recommendation(
+    def parse_response(
         self, 
         response_content: str, 
         request: CourseRequest
@@ -2,10 +2,16 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from app.agents.base_agent import BaseInterviewAgent
-from app.agents.recommender_prompts import EVENT_RECOMMENDER_PROMPT
+from app.agents.recommender_prompts import (
+    EVENT_RECOMMENDER_DYNAMIC,
+    get_output_schema,
+    get_static_prompt,
+    render_event_prompt,
+)
+from app.agents.semantic_cache import acached_generate, cached_generate
 from app.models.recommender_schemas import (
     EventMatch,
     EventRecommendation,
@@ -34,7 +40,16 @@ class EventRecommenderAgent(BaseInterviewAgent):
         super().__init__(temperature=0.7, **kwargs)
     
     def get_prompt_template(self) -> str:
-        return EVENT_RECOMMENDER_PROMPT
+        return EVENT_RECOMMENDER_DYNAMIC
+    
+    def format_prompt(self, **kwargs: Any) -> str:
+        return render_event_prompt(**kwargs)
+    
+    def get_output_schema(self) -> Optional[Dict[str, Any]]:
+        return get_output_schema("event")
+    
+    def get_system_prompt(self, **kwargs: Any) -> Optional[str]:
+        return get_static_prompt("event", kwargs.get("location_preference"))
     
     def get_default_response(self) -> Dict[str, Any]:
         """Return a default response structure."""
@@ -66,23 +81,13 @@ class EventRecommenderAgent(BaseInterviewAgent):
         Returns:
             EventRecommendation with matched events
         """
-        prefs = request.preferences
-        
         try:
-            response = await self.invoke(
-                academic_year=prefs.academic_year,
-                track=prefs.track,
-                skills=", ".join(prefs.skills) if prefs.skills else "Not specified",
-                interests=", ".join(prefs.interests) if prefs.interests else "Not specified",
-                location_preference=prefs.location_preference,
-                availability=prefs.availability or "Flexible",
-                event_types=", ".join(request.event_types),
-                timeframe=request.timeframe,
-                include_online=str(request.include_online),
+            variables = self.prompt_variables(request)
+            response = await acached_generate(
+                "event", variables, lambda: self.invoke(**variables)
             )
             
-            parsed = self.parse_json_response(response)
-            return self._build_recommendation(parsed, request.max_results)
+            return self.parse_response(response, request)
             
         except Exception as e:
             logger.error(f"Error generating event recommendations: {e}")
@@ -93,28 +98,37 @@ class EventRecommenderAgent(BaseInterviewAgent):
         request: EventRequest
     ) -> EventRecommendation:
         """Synchronous version of recommend."""
-        prefs = request.preferences
-        
         try:
-            response = self.invoke_sync(
-                academic_year=prefs.academic_year,
-                track=prefs.track,
-                skills=", ".join(prefs.skills) if prefs.skills else "Not specified",
-                interests=", ".join(prefs.interests) if prefs.interests else "Not specified",
-                location_preference=prefs.location_preference,
-                availability=prefs.availability or "Flexible",
-                event_types=", ".join(request.event_types),
-                timeframe=request.timeframe,
-                include_online=str(request.include_online),
+            variables = self.prompt_variables(request)
+            response = cached_generate(
+                "event", variables, lambda: self.invoke_sync(**variables)
             )
             
-            parsed = self.parse_json_response(response)
-            return self._build_recommendation(parsed, request.max_results)
+            return self.parse_response(response, request)
             
         except Exception as e:
             logger.error(f"Error generating event recommendations: {e}")
             raise
     
+    def prompt_variables(self, request: EventRequest) -> Dict[str, Any]:
+        """Map the request onto the prompt template variables."""
+        prefs = request.preferences
+        return {
+            "academic_year": prefs.academic_year,
+            "track": prefs.track,
+            "skills": ", ".join(prefs.skills) if prefs.skills else "Not specified",
+            "interests": ", ".join(prefs.interests) if prefs.interests else "Not specified",
+            "location_preference": prefs.location_preference,
+            "availability": prefs.availability or "Flexible",
+            "event_types": ", ".join(request.event_types),
+            "timeframe": request.timeframe,
+            "include_online": str(request.include_online),
+        }
+    
+    def parse_response(self, response: str, request: EventRequest) -> EventRecommendation:
+        """Parse a raw LLM response into a EventRecommendation."""
+        return self._build_recommendation(self.parse_json_response(response), request.max_results)
+    
     def _build_recommendation(
         self, 
         data: Dict[str, Any], 
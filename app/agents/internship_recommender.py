@@ -2,10 +2,16 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, Optional
 
 from app.agents.base_agent import BaseInterviewAgent
-from app.agents.recommender_prompts import INTERNSHIP_RECOMMENDER_PROMPT
+from app.agents.recommender_prompts import (
+    INTERNSHIP_RECOMMENDER_DYNAMIC,
+    get_output_schema,
+    get_static_prompt,
+    render_internship_prompt,
+)
+from app.agents.semantic_cache import acached_generate, cached_generate
 from app.models.recommender_schemas import (
     InternshipMatch,
     InternshipRecommendation,
@@ -31,7 +37,16 @@ class InternshipRecommenderAgent(BaseInterviewAgent):
         super().__init__(temperature=0.7, **kwargs)
     
     def get_prompt_template(self) -> str:
-        return INTERNSHIP_RECOMMENDER_PROMPT
+        return INTERNSHIP_RECOMMENDER_DYNAMIC
+    
+    def format_prompt(self, **kwargs: Any) -> str:
+        return render_internship_prompt(**kwargs)
+    
+    def get_output_schema(self) -> Optional[Dict[str, Any]]:
+        return get_output_schema("internship")
+    
+    def get_system_prompt(self, **kwargs: Any) -> Optional[str]:
+        return get_static_prompt("internship", kwargs.get("location_preference"))
     
     def get_default_response(self) -> Dict[str, Any]:
         """Return a default response structure."""
@@ -58,21 +73,13 @@ class InternshipRecommenderAgent(BaseInterviewAgent):
         Returns:
             InternshipRecommendation with matched opportunities
         """
-        prefs = request.preferences
-        
         try:
-            response = await self.invoke(
-                academic_year=prefs.academic_year,
-                track=prefs.track,
-                skills=", ".join(prefs.skills) if prefs.skills else "Not specified",
-                interests=", ".join(prefs.interests) if prefs.interests else "Not specified",
-                location_preference=prefs.location_preference,
-                availability=prefs.availability or "Flexible",
-                notes=prefs.notes or "None",
+            variables = self.prompt_variables(request)
+            response = await acached_generate(
+                "internship", variables, lambda: self.invoke(**variables)
             )
             
-            parsed = self.parse_json_response(response)
-            return self._build_recommendation(parsed, request.max_results)
+            return self.parse_response(response, request)
             
         except Exception as e:
             logger.error(f"Error generating internship recommendations: {e}")
@@ -83,26 +90,35 @@ class InternshipRecommenderAgent(BaseInterviewAgent):
         request: InternshipRequest
     ) -> InternshipRecommendation:
         """Synchronous version of recommend."""
-        prefs = request.preferences
-        
         try:
-            response = self.invoke_sync(
-                academic_year=prefs.academic_year,
-                track=prefs.track,
-                skills=", ".join(prefs.skills) if prefs.skills else "Not specified",
-                interests=", ".join(prefs.interests) if prefs.interests else "Not specified",
-                location_preference=prefs.location_preference,
-                availability=prefs.availability or "Flexible",
-                notes=prefs.notes or "None",
+            variables = self.prompt_variables(request)
+            response = cached_generate(
+                "internship", variables, lambda: self.invoke_sync(**variables)
             )
             
-            parsed = self.parse_json_response(response)
-            return self._build_recommendation(parsed, request.max_results)
+            return self.parse_response(response, request)
             
         except Exception as e:
             logger.error(f"Error generating internship recommendations: {e}")
             raise
     
+    def prompt_variables(self, request: InternshipRequest) -> Dict[str, Any]:
+        """Map the request onto the prompt template variables."""
+        prefs = request.preferences
+        return {
+            "academic_year": prefs.academic_year,
+            "track": prefs.track,
+            "skills": ", ".join(prefs.skills) if prefs.skills else "Not specified",
+            "interests": ", ".join(prefs.interests) if prefs.interests else "Not specified",
+            "location_preference": prefs.location_preference,
+            "availability": prefs.availability or "Flexible",
+            "notes": prefs.notes or "None",
+        }
+    
+    def parse_response(self, response: str, request: InternshipRequest) -> InternshipRecommendation:
+        """Parse a raw LLM response into a InternshipRecommendation."""
+        return self._build_recommendation(self.parse_json_response(response), request.max_results)
+    
     def _build_recommendation(
         self, 
         data: Dict[str, Any], 
@@ -2,10 +2,16 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from app.agents.base_agent import BaseInterviewAgent
-from app.agents.recommender_prompts import PRACTICAL_PROJECT_RECOMMENDER_PROMPT
+from app.agents.recommender_prompts import (
+    PRACTICAL_PROJECT_RECOMMENDER_DYNAMIC,
+    get_output_schema,
+    get_static_prompt,
+    render_project_prompt,
+)
+from app.agents.semantic_cache import acached_generate, cached_generate
 from app.models.recommender_schemas import (
     ProjectBuildRecommendation,
     YouTubeProjectPlaylist,
@@ -33,7 +39,16 @@ class PracticalProjectRecommenderAgent(BaseInterviewAgent):
         super().__init__(temperature=0.7, **kwargs)
     
     def get_prompt_template(self) -> str:
-        return PRACTICAL_PROJECT_RECOMMENDER_PROMPT
+        return PRACTICAL_PROJECT_RECOMMENDER_DYNAMIC
+    
+    def format_prompt(self, **kwargs: Any) -> str:
+        return render_project_prompt(**kwargs)
+    
+    def get_output_schema(self) -> Optional[Dict[str, Any]]:
+        return get_output_schema("project")
+    
+    def get_system_prompt(self, **kwargs: Any) -> Optional[str]:
+        return get_static_prompt("project")
     
     def get_default_response(self) -> Dict[str, Any]:
         """Return a default response structure."""
@@ -61,15 +76,12 @@ class PracticalProjectRecommenderAgent(BaseInterviewAgent):
             PracticalProjectResponse with project recommendations
         """
         try:
-            response = await self.invoke(
-                topic=request.topic,
-                current_level=request.current_level,
-                time_available=request.time_available,
-                focus_on_portfolio=str(request.focus_on_portfolio),
+            variables = self.prompt_variables(request)
+            response = await acached_generate(
+                "project", variables, lambda: self.invoke(**variables)
             )
             
-            parsed = self.parse_json_response(response)
-            return self._build_recommendation(parsed, request.max_projects)
+            return self.parse_response(response, request)
             
         except Exception as e:
             logger.error(f"Error generating project recommendations: {e}")
@@ -81,20 +93,30 @@ class PracticalProjectRecommenderAgent(BaseInterviewAgent):
     ) -> PracticalProjectResponse:
         """Synchronous version of recommend."""
         try:
-            response = self.invoke_sync(
-                topic=request.topic,
-                current_level=request.current_level,
-                time_available=request.time_available,
-                focus_on_portfolio=str(request.focus_on_portfolio),
+            variables = self.prompt_variables(request)
+            response = cached_generate(
+                "project", variables, lambda: self.invoke_sync(**variables)
             )
             
-            parsed = self.parse_json_response(response)
-            return self._build_recommendation(parsed, request.max_projects)
+            return self.parse_response(response, request)
             
         except Exception as e:
             logger.error(f"Error generating project recommendations: {e}")
             raise
     
+    def prompt_variables(self, request: ProjectRequest) -> Dict[str, Any]:
+        """Map the request onto the prompt template variables."""
+        return {
+            "topic": request.topic,
+            "current_level": request.current_level,
+            "time_available": request.time_available,
+            "focus_on_portfolio": str(request.focus_on_portfolio),
+        }
+    
+    def parse_response(self, response: str, request: ProjectRequest) -> PracticalProjectResponse:
+        """Parse a raw LLM response into a PracticalProjectResponse."""
+        return self._build_recommendation(self.parse_json_response(response), request.max_projects)
+    
     def _build_recommendation(
         self, 
         data: Dict[str, Any],
@@ -0,0 +1,275 @@
+"""Recommender Batch Runner - Submits many recommender requests as one provider batch job.
+
+Every request in a batch shares the same static system prompt and response
+schema and only differs in its rendered dynamic tail, which is the shape the
+OpenAI Batch API and the Anthropic Message Batches API are priced and
+optimized for.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Dict, List, Literal, Optional, Union
+
+from pydantic import BaseModel
+
+from app.agents.course_recommender import CourseRecommenderAgent
+from app.agents.event_recommender import EventRecommenderAgent
+from app.agents.internship_recommender import InternshipRecommenderAgent
+from app.agents.project_recommender import PracticalProjectRecommenderAgent
+from app.agents.recommender_prompts import (
+    RECOMMENDER_KINDS,
+    build_recommender_messages,
+    get_output_schema,
+)
+from app.agents.skills_tools_recommender import SkillsToolsRecommenderAgent
+from app.providers import LLMProvider, ProviderType, get_provider
+
+logger = logging.getLogger(__name__)
+
+RecommenderKind = Literal["internship", "event", "course", "skills_tools", "project"]
+
+_RECOMMENDER_AGENTS = {
+    "internship": InternshipRecommenderAgent,
+    "event": EventRecommenderAgent,
+    "course": CourseRecommenderAgent,
+    "skills_tools": SkillsToolsRecommenderAgent,
+    "project": PracticalProjectRecommenderAgent,
+}
+
+_INITIAL_POLL_INTERVAL = 5.0
+_MAX_POLL_INTERVAL = 60.0
+
+
+def _custom_id(prompt_name: str, index: int) -> str:
+    return f"{prompt_name}-{index}"
+
+
+def _schema_name(prompt_name: str) -> str:
+    return f"{prompt_name}_recommendation"
+
+
+def _build_requests(
+    prompt_name: str,
+    rows: List[Dict[str, Any]],
+    cache_control: bool = False,
+) -> List[List[Dict[str, Any]]]:
+    """Return the chat messages for each row; all rows share one system prompt."""
+    if prompt_name not in RECOMMENDER_KINDS:
+        raise ValueError(
+            f"Unknown recommender prompt: {prompt_name}. "
+            f"Supported: {list(RECOMMENDER_KINDS)}"
+        )
+    return [build_recommender_messages(prompt_name, cache_control, **row) for row in rows]
+
+
+async def _wait_for(check, timeout: Optional[float]) -> Any:
+    """Poll ``check`` with exponential backoff until it returns a non-None value."""
+    interval = _INITIAL_POLL_INTERVAL
+    started = time.monotonic()
+    while True:
+        result = await check()
+        if result is not None:
+            return result
+        if timeout is not None and time.monotonic() - started > timeout:
+            raise TimeoutError(f"Batch job did not finish within {timeout} seconds")
+        await asyncio.sleep(interval)
+        interval = min(interval * 2, _MAX_POLL_INTERVAL)
+
+
+async def _run_openai_batch(
+    provider: LLMProvider,
+    prompt_name: str,
+    rows: List[Dict[str, Any]],
+    timeout: Optional[float],
+) -> Dict[str, str]:
+    client = provider.async_client
+    response_format = {
+        "type": "json_schema",
+        "json_schema": {"name": _schema_name(prompt_name), "schema": get_output_schema(prompt_name)},
+    }
+    lines = [
+        json.dumps({
+            "custom_id": _custom_id(prompt_name, i),
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": provider.model,
+                "temperature": provider.temperature,
+                "messages": messages,
+                "response_format": response_format,
+            },
+        }, ensure_ascii=False)
+        for i, messages in enumerate(_build_requests(prompt_name, rows))
+    ]
+    input_file = await client.files.create(
+        file=(f"{prompt_name}_batch.jsonl", "\n".join(lines).encode("utf-8")),
+        purpose="batch",
+    )
+    batch = await client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    logger.info(f"Submitted OpenAI batch {batch.id} with {len(lines)} {prompt_name} requests")
+
+    async def check():
+        current = await client.batches.retrieve(batch.id)
+        if current.status == "completed":
+            return current
+        if current.status in ("failed", "expired", "cancelled"):
+            raise RuntimeError(f"OpenAI batch {batch.id} ended with status {current.status}")
+        return None
+
+    finished = await _wait_for(check, timeout)
+    if not finished.output_file_id:
+        return {}
+
+    output = await client.files.content(finished.output_file_id)
+    results: Dict[str, str] = {}
+    for line in output.text.splitlines():
+        if not line.strip():
+            continue
+        entry = json.loads(line)
+        response = entry.get("response") or {}
+        if response.get("status_code") != 200:
+            logger.warning(f"Batch request {entry.get('custom_id')} failed: {entry.get('error')}")
+            continue
+        results[entry["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+    return results
+
+
+async def _run_anthropic_batch(
+    provider: LLMProvider,
+    prompt_name: str,
+    rows: List[Dict[str, Any]],
+    timeout: Optional[float],
+) -> Dict[str, str]:
+    try:
+        import anthropic
+    except ImportError:
+        raise ImportError(
+            "anthropic package is required for Anthropic batches. "
+            "Install it with: pip install anthropic"
+        )
+
+    client = anthropic.AsyncAnthropic(api_key=provider.api_key)
+    # The shared system block carries a cache_control breakpoint so every request
+    # in the batch after the first reads it from the prompt cache.
+    requests = _build_requests(prompt_name, rows, cache_control=True)
+    # The response schema is passed as a forced tool call; its input is the JSON.
+    tool = {
+        "name": _schema_name(prompt_name),
+        "description": f"Return the {prompt_name} recommendations.",
+        "input_schema": get_output_schema(prompt_name),
+    }
+    batch = await client.messages.batches.create(
+        requests=[
+            {
+                "custom_id": _custom_id(prompt_name, i),
+                "params": {
+                    "model": provider.model,
+                    "max_tokens": 4096,
+                    "temperature": provider.temperature,
+                    "system": messages[0]["content"],
+                    "messages": messages[1:],
+                    "tools": [tool],
+                    "tool_choice": {"type": "tool", "name": tool["name"]},
+                },
+            }
+            for i, messages in enumerate(requests)
+        ]
+    )
+    logger.info(f"Submitted Anthropic batch {batch.id} with {len(requests)} {prompt_name} requests")
+
+    async def check():
+        current = await client.messages.batches.retrieve(batch.id)
+        return current if current.processing_status == "ended" else None
+
+    await _wait_for(check, timeout)
+
+    results: Dict[str, str] = {}
+    async for entry in await client.messages.batches.results(batch.id):
+        if entry.result.type != "succeeded":
+            logger.warning(f"Batch request {entry.custom_id} finished as {entry.result.type}")
+            continue
+        for block in entry.result.message.content:
+            if block.type == "tool_use":
+                results[entry.custom_id] = json.dumps(block.input, ensure_ascii=False)
+                break
+    return results
+
+
+async def run_batch(
+    prompt_name: RecommenderKind,
+    rows: List[Dict[str, Any]],
+    provider: Optional[Union[str, ProviderType]] = None,
+    model: Optional[str] = None,
+    temperature: float = 0.7,
+    timeout: Optional[float] = None,
+) -> List[Optional[str]]:
+    """
+    Run one recommender prompt for many rows as a single batch job.
+    
+    Args:
+        prompt_name: Recommender kind ("internship", "event", "course", "skills_tools", "project")
+        rows: Template variables for each request
+        provider: "openai" or "anthropic". If None, uses settings
+        model: Model name. If None, uses the provider default
+        temperature: Temperature for generation
+        timeout: Maximum seconds to wait for the batch. If None, waits until it ends
+        
+    Returns:
+        Raw response text per row, in input order (None for failed rows)
+    """
+    if not rows:
+        return []
+
+    llm_provider = get_provider(provider_type=provider, model=model, temperature=temperature)
+    if llm_provider.provider_type == ProviderType.OPENAI:
+        results = await _run_openai_batch(llm_provider, prompt_name, rows, timeout)
+    elif llm_provider.provider_type == ProviderType.ANTHROPIC:
+        results = await _run_anthropic_batch(llm_provider, prompt_name, rows, timeout)
+    else:
+        raise ValueError(
+            f"Batch API is not supported for provider: {llm_provider.provider_type.value}"
+        )
+
+    return [results.get(_custom_id(prompt_name, i)) for i in range(len(rows))]
+
+
+async def batch_recommend(
+    requests: List[BaseModel],
+    kind: RecommenderKind,
+    **kwargs: Any,
+) -> List[Optional[BaseModel]]:
+    """
+    Generate recommendations for many requests in one batch job.
+    
+    Requests are mapped to prompt variables and responses are parsed by the
+    recommender agent for ``kind``, exactly as a live ``recommend`` call would.
+    
+    Args:
+        requests: Request models for the kind (e.g. InternshipRequest, CourseRequest)
+        kind: Recommender kind
+        **kwargs: Forwarded to run_batch (provider, model, temperature, timeout)
+        
+    Returns:
+        Recommendation per request, in input order (None for failed rows)
+    """
+    if kind not in _RECOMMENDER_AGENTS:
+        raise ValueError(
+            f"Unknown recommender prompt: {kind}. "
+            f"Supported: {list(RECOMMENDER_KINDS)}"
+        )
+    # Agents create their LLM on first use, so this never builds a chat model
+    # for settings.llm_provider; only the request mapping and parsing are used.
+    agent = _RECOMMENDER_AGENTS[kind]()
+    rows = [agent.prompt_variables(request) for request in requests]
+    responses = await run_batch(kind, rows, **kwargs)
+    return [
+        agent.parse_response(response, request) if response is not None else None
+        for response, request in zip(responses, requests)
+    ]
@@ -1,854 +1,348 @@
-"""Prompts for the Recommender Multi-Agent System."""
-
-INTERNSHIP_RECOMMENDER_PROMPT = """You are an expert Career Advisor and Internship Matchmaker.
-Your role is to recommend the best internship opportunities based on student profiles.
-
-## Your Expertise:
-- Understanding student skills and career goals
-- Matching candidates with suitable opportunities
-- Identifying skill gaps and growth opportunities
-- Providing actionable career advice
-
-## STUDENT PROFILE:
-- **Academic Year**: {academic_year}
-- **Track/Major**: {track}
-- **Skills**: {skills}
-- **Interests**: {interests}
-- **Location Preference**: {location_preference}
-- **Availability**: {availability}
-- **Additional Notes**: {notes}
-
-## YOUR TASK:
-Recommend the best internship opportunities for this student.
-
-### Generate 5-8 Internship Recommendations:
-For each internship, provide:
-1. **Title**: Specific job title
-2. **Company**: Company name (use real company names relevant to the track)
-3. **Location**: Job location
-4. **Work Type**: remote, hybrid, or on-site
-5. **Description**: 2-3 sentence description
-6. **Requirements**: 3-5 key requirements
-7. **Match Score**: 0-100 based on profile fit
-8. **Match Reasons**: 3-4 specific reasons why this matches
-9. **Skills Matched**: Skills from profile that match
-10. **Skills to Develop**: Skills to learn for this role
-11. **Icon**: Relevant emoji
-
-### Also Provide:
-- **User Profile Summary**: 1-2 sentence summary of the profile
-- **Alternative Paths**: 2-3 alternative career paths to consider
-- **Skill Gaps**: Top skills to develop for better opportunities
-- **Recommended Actions**: 3-5 action items for the user
-- **Search Tips**: 3-4 job searching tips
-
-## LOCATION CONSIDERATIONS:
-- If "egypt": Focus on Egyptian companies (Vodafone Egypt, Orange, Valeo, InstaPay, Swvl, etc.)
-- If "abroad": Include international companies with visa sponsorship
-- If "remote": Focus on remote-first companies
-- If "hybrid": Mix of local and remote options
-
-## OUTPUT FORMAT:
-Return valid JSON:
-{{
-    "user_profile_summary": "Summary of the student profile",
-    "total_matches": 8,
-    "top_recommendations": [
-        {{
-            "title": "Software Engineering Intern",
-            "company": "Company Name",
-            "location": "Cairo, Egypt",
-            "work_type": "hybrid",
-            "description": "Description of the role",
-            "requirements": ["Requirement 1", "Requirement 2"],
-            "match_score": 85,
-            "match_reasons": ["Reason 1", "Reason 2"],
-            "skills_matched": ["Python", "SQL"],
-            "skills_to_develop": ["Docker", "AWS"],
-            "application_url": null,
-            "deadline": null,
-            "icon": "💼"
-        }}
-    ],
-    "alternative_paths": ["Path 1", "Path 2"],
-    "skill_gaps": ["Skill 1", "Skill 2"],
-    "recommended_actions": ["Action 1", "Action 2"],
-    "search_tips": ["Tip 1", "Tip 2"]
-}}
-
-Return ONLY valid JSON, no additional text.
+"""Prompts for the Recommender Multi-Agent System.
+
+Each prompt is split into a static part (sent as the system message, so the
+provider can cache it as a prompt prefix) and a dynamic part holding only the
+request-specific fields (sent as the user message). The static parts live in
+``prompt_templates/*.txt`` and are loaded lazily on first use. The response
+format is not described in the prompt text; it is passed to the provider as a
+JSON schema derived from the response models (see ``get_output_schema``).
 """
+import functools
+import mmap
+import re
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 
+from pydantic import BaseModel
 
-EVENT_RECOMMENDER_PROMPT = """You are an expert Event Curator and Hackathon Specialist.
-Your role is to recommend the best events, hackathons, and learning opportunities.
-
-## Your Expertise:
-- Finding relevant hackathons and coding competitions
-- Identifying valuable workshops and conferences
-- Matching students with growth opportunities
-- Understanding the tech event ecosystem
-
-## STUDENT PROFILE:
-- **Academic Year**: {academic_year}
-- **Track/Major**: {track}
-- **Skills**: {skills}
-- **Interests**: {interests}
-- **Location Preference**: {location_preference}
-- **Availability**: {availability}
-- **Event Types Requested**: {event_types}
-- **Timeframe**: {timeframe}
-- **Include Online**: {include_online}
-
-## YOUR TASK:
-Recommend the best events and hackathons for this student.
-
-### Generate Recommendations by Category:
-
-#### HACKATHONS (3-5):
-- Major hackathons (MLH, DevPost, Google, Microsoft, etc.)
-- Local hackathons (if Egypt: Egyptian hackathons, ICPC Egypt, etc.)
-- Online hackathons for remote participation
-
-#### WORKSHOPS (2-4):
-- Technical workshops for skill building
-- Industry workshops from tech companies
-- University or community workshops
-
-#### COMPETITIONS (2-3):
-- Coding competitions (Codeforces, LeetCode contests, etc.)
-- Case competitions
-- Innovation challenges
-
-#### CONFERENCES (2-3):
-- Tech conferences (virtual and in-person)
-- Industry-specific conferences
-- Student-focused tech events
-
-#### MEETUPS (2-3):
-- Local tech meetups
-- Online community events
-- Networking events
-
-### For Each Event Provide:
-1. **Name**: Event name
-2. **Organizer**: Who organizes it
-3. **Event Type**: hackathon, workshop, conference, etc.
-4. **Format**: online, in-person, hybrid
-5. **Location**: If in-person
-6. **Date Range**: Event dates (use realistic upcoming dates)
-7. **Description**: What the event is about
-8. **Themes**: Topics/tracks covered
-9. **Prizes**: If applicable
-10. **Requirements**: Participation requirements
-11. **Match Score**: 0-100 based on relevance
-12. **Match Reasons**: Why this matches the student
-13. **Skills to Gain**: What they'll learn
-14. **Networking Value**: low, medium, high
-15. **Difficulty Level**: beginner, intermediate, advanced
-16. **Team Size**: If team-based
-17. **Icon**: Relevant emoji
-
-### Also Provide:
-- **Preparation Tips**: 4-6 tips to prepare for events
-- **Benefits**: Benefits of participating in events
-- **Upcoming Deadlines**: Events with soon deadlines
-
-## LOCATION CONSIDERATIONS:
-- If "egypt": Include Egyptian events (ECPC, local hackathons, Cairo tech meetups)
-- If "abroad": Include international events
-- Include online events if requested
-
-## OUTPUT FORMAT:
-Return valid JSON:
-{{
-    "user_profile_summary": "Summary",
-    "total_events": 15,
-    "hackathons": [
-        {{
-            "name": "Hackathon Name",
-            "organizer": "Organizer",
-            "event_type": "hackathon",
-            "format": "hybrid",
-            "location": "Cairo, Egypt",
-            "date_range": "March 15-17, 2025",
-            "description": "Description",
-            "themes": ["AI", "Web3"],
-            "prizes": "$10,000 total",
-            "requirements": ["Requirement 1"],
-            "match_score": 90,
-            "match_reasons": ["Reason 1"],
-            "skills_to_gain": ["Skill 1"],
-            "networking_value": "high",
-            "registration_url": null,
-            "registration_deadline": "March 1, 2025",
-            "difficulty_level": "intermediate",
-            "team_size": "2-4 members",
-            "icon": "🏆"
-        }}
-    ],
-    "workshops": [],
-    "conferences": [],
-    "competitions": [],
-    "meetups": [],
-    "recommended_projects": [
-        {{
-            "name": "Project Name",
-            "level": "beginner|intermediate|advanced",
-            "description": "Brief description",
-            "what_you_will_build": "Detailed explanation of what student will create",
-            "skills_gained": ["Skill 1", "Skill 2", "Skill 3"],
-            "real_work_connection": "How this mirrors real industry work",
-            "cv_value": "Why this is valuable for CV/portfolio",
-            "relevant_roles": ["Software Engineer", "Data Scientist"],
-            "tech_stack": ["Python", "React", "PostgreSQL"],
-            "estimated_duration": "2-3 weeks",
-            "github_guidance": {{
-                "repo_name": "professional-repo-name",
-                "folder_structure": "/src\\n/docs\\n/tests\\nREADME.md\\nrequirements.txt\\n.gitignore",
-                "readme_should_contain": [
-                    "Project Overview",
-                    "Problem Statement",
-                    "Features",
-                    "Tech Stack",
-                    "Setup Instructions",
-                    "Usage Examples",
-                    "Screenshots/Demo",
-                    "Future Improvements"
-                ],
-                "professional_practices": [
-                    "Write clear, descriptive commit messages",
-                    "Use feature branches for development",
-                    "Add comprehensive documentation",
-                    "Include sample data or API examples",
-                    "Add screenshots or demo GIFs",
-                    "Write basic tests if possible"
-                ],
-                "sample_commit_messages": [
-                    "feat: Add user authentication system",
-                    "fix: Resolve database connection timeout",
-                    "docs: Update API documentation"
-                ]
-            }},
-            "match_score": 85,
-            "icon": "💼"
-        }}
-    ],
-    "youtube_playlists": [
-        {{
-            "title": "Build a Full Stack E-Commerce App",
-            "focus": "Complete MERN stack e-commerce application with payment integration",
-            "level": "intermediate",
-            "url": "https://youtube.com/playlist?list=EXAMPLE",
-            "channel": "Traversy Media",
-            "duration": "8 hours / 20 videos",
-            "icon": "🎬"
-        }}
-    ],
-    "preparation_tips": ["Tip 1"],
-    "benefits": ["Benefit 1"],
-    "upcoming_deadlines": [
-        {{"event": "Event Name", "deadline": "Date", "days_left": 10}}
-    ]
-}}
-
-**IMPORTANT - PRACTICAL PROJECT RECOMMENDATIONS:**
-
-### Generate 3-6 Project Recommendations:
-Include at minimum:
-- 1-2 Beginner Projects
-- 1-2 Intermediate Projects  
-- 1-2 Advanced/Real-World Projects
-
-**Each project must:**
-- Be realistic and portfolio-ready
-- Mirror real industry tasks
-- Include detailed GitHub structuring guidance
-- Specify exact tech stack
-- Explain CV/employability value
-- Connect to actual job roles
-
-### Generate 3-6 YouTube Project Playlists:
-**CRITICAL REQUIREMENTS:**
-- Recommend ONLY playlists that BUILD REAL PROJECTS
-- NO lecture-only or theory content
-- Must be step-by-step project tutorials
-- Focus on implementation and building
-- Include realistic YouTube URLs when possible
-- Mix of beginner, intermediate, and advanced levels
-
-**For folder_structure, use this format:**
-```
-/src
-  /components
-  /services
-  /utils
-/docs
-/tests
-/config
-README.md
-requirements.txt or package.json
-.env.example
-.gitignore
-```
-
-**Adapt structure based on project type:**
-- Backend: /src, /models, /routes, /controllers, /middleware
-- Frontend: /src, /components, /pages, /assets, /hooks
-- Data Science: /data, /notebooks, /models, /src, /tests
-- Full-Stack: Combine both structures
-
-Return ONLY valid JSON, no additional text.
+from app.config import settings
+from app.models.recommender_schemas import (
+    CourseRecommendation,
+    EventRecommendation,
+    InternshipRecommendation,
+    PracticalProjectResponse,
+    SkillsToolsRecommendation,
+)
+
+
+RECOMMENDER_KINDS = ("internship", "event", "course", "skills_tools", "project")
+
+
+INTERNSHIP_RECOMMENDER_DYNAMIC = """## STUDENT PROFILE:
+- Academic Year: {academic_year}
+- Track/Major: {track}
+- Location Preference: {location_preference}
+- Availability: {availability}
+- Interests: {interests}
+- Skills: {skills}
+- Additional Notes: {notes}
+
+Recommend the best internship opportunities for this student. Return ONLY valid JSON, no additional text.
 """
 
 
-COURSE_RECOMMENDER_PROMPT = """You are an expert Learning Advisor and Course Curator.
-Your role is to recommend the best courses and certifications for any topic.
-
-## Your Expertise:
-- Knowledge of top learning platforms (Coursera, Udemy, edX, Pluralsight, LinkedIn Learning, etc.)
-- Understanding of industry-recognized certifications
-- Matching learners with appropriate difficulty levels
-- Creating effective learning paths
-
-## TOPIC REQUESTED:
-- **Topic**: {topic}
-- **Current Level**: {current_level}
-- **Learning Goal**: {learning_goal}
-- **Time Available**: {time_available}
-- **Budget**: {budget}
-- **Prefer Certificates**: {prefer_certificates}
-
-## YOUR TASK:
-Recommend the best courses and certifications for this topic.
-
-### COURSES (Generate 8-12 total):
-Categorize into:
-1. **Free Courses** (3-4): Quality free options
-2. **Paid Courses** (3-4): Premium/comprehensive courses
-3. **Beginner Courses** (2-3): For those starting out
-4. **Advanced Courses** (2-3): For deeper mastery
-
-For each course provide:
-- name: Course title
-- provider: Platform (Coursera, Udemy, etc.)
-- instructor: Instructor name if known
-- course_type: course, specialization, or bootcamp
-- difficulty: beginner, intermediate, advanced
-- duration: Time to complete
-- description: Brief description
-- topics_covered: Key topics (3-5)
-- skills_gained: Skills learned (3-5)
-- match_score: 0-100 relevance
-- match_reasons: Why it's recommended (2-3)
-- rating: 0-5 stars
-- num_reviews: Approximate reviews
-- price: Price or "Free"
-- is_free: true/false
-- has_certificate: true/false
-- icon: Emoji
-
-### CERTIFICATIONS (Generate 3-5):
-Include industry-recognized certifications:
-- Google, AWS, Microsoft, Meta, IBM certifications
-- Professional certifications in the field
-
-For each certification provide:
-- name: Certification name
-- issuer: Issuing organization
-- certification_type: associate, professional, expert
-- difficulty: beginner, intermediate, advanced
-- description: What it validates
-- skills_validated: Skills covered (3-5)
-- prerequisites: Required prerequisites
-- exam_details: Exam format/duration
-- preparation_time: Typical prep time
-- match_score: 0-100 relevance
-- match_reasons: Why recommended (2-3)
-- industry_recognition: low, medium, high
-- validity_period: How long it's valid
-- cost: Approximate cost
-- icon: Emoji
-
-### ALSO PROVIDE:
-- recommended_learning_path: Ordered list of 5-7 steps
-- time_to_proficiency: Estimated time to become proficient
-- study_tips: 4-6 study tips for this topic
-
-## POPULAR PLATFORMS TO CONSIDER:
-- Coursera, edX, Udemy, Pluralsight, LinkedIn Learning
-- YouTube (for free content), freeCodeCamp, Khan Academy
-- Platform-specific: Google Skillshop, AWS Training, Microsoft Learn
-
-## OUTPUT FORMAT:
-Return valid JSON:
-{{
-    "topic": "{topic}",
-    "user_profile_summary": "Summary of learner context",
-    "total_courses": 10,
-    "total_certifications": 4,
-    "free_courses": [
-        {{
-            "name": "Course Name",
-            "provider": "Coursera",
-            "instructor": "Instructor Name",
-            "course_type": "course",
-            "difficulty": "beginner",
-            "duration": "4 weeks",
-            "description": "Description",
-            "topics_covered": ["Topic 1", "Topic 2"],
-            "skills_gained": ["Skill 1", "Skill 2"],
-            "match_score": 85,
-            "match_reasons": ["Reason 1"],
-            "rating": 4.7,
-            "num_reviews": "50,000+",
-            "price": "Free",
-            "is_free": true,
-            "has_certificate": true,
-            "url": null,
-            "icon": "📚"
-        }}
-    ],
-    "paid_courses": [],
-    "beginner_courses": [],
-    "advanced_courses": [],
-    "certifications": [
-        {{
-            "name": "Google Data Analytics Certificate",
-            "issuer": "Google",
-            "certification_type": "professional",
-            "difficulty": "beginner",
-            "description": "Description",
-            "skills_validated": ["Skill 1"],
-            "prerequisites": ["None"],
-            "exam_details": "6-course series",
-            "preparation_time": "3-6 months",
-            "match_score": 90,
-            "match_reasons": ["Reason 1"],
-            "industry_recognition": "high",
-            "validity_period": "No expiration",
-            "cost": "$39/month on Coursera",
-            "url": null,
-            "icon": "🏅"
-        }}
-    ],
-    "recommended_learning_path": ["Step 1", "Step 2"],
-    "time_to_proficiency": "3-6 months",
-    "study_tips": ["Tip 1", "Tip 2"]
-}}
-
-Return ONLY valid JSON, no additional text.
+EVENT_RECOMMENDER_DYNAMIC = """## STUDENT PROFILE:
+- Academic Year: {academic_year}
+- Track/Major: {track}
+- Location Preference: {location_preference}
+- Availability: {availability}
+- Include Online: {include_online}
+- Timeframe: {timeframe}
+- Event Types Requested: {event_types}
+- Interests: {interests}
+- Skills: {skills}
+
+Recommend the best events and hackathons for this student. Return ONLY valid JSON, no additional text.
 """
 
 
-SKILLS_TOOLS_RECOMMENDER_PROMPT = """You are an expert Tech Advisor and Skills Analyst.
-Your role is to recommend the most relevant skills and tools for any topic.
-
-## Your Expertise:
-- Deep knowledge of tech industry skill requirements
-- Understanding of tool ecosystems and alternatives
-- Tracking industry trends and emerging technologies
-- Career pathway and skill progression knowledge
-
-## TOPIC REQUESTED:
-- **Topic**: {topic}
-- **Current Skills**: {current_skills}
-- **Career Goal**: {career_goal}
-- **Experience Level**: {experience_level}
-- **Focus Area**: {focus_area}
-- **Include Soft Skills**: {include_soft_skills}
-
-## YOUR TASK:
-Recommend the most relevant skills and tools for this topic.
-
-### SKILLS TO RECOMMEND:
-
-#### Core Skills (4-6):
-Essential skills directly related to the topic
-
-#### Complementary Skills (3-5):
-Skills that enhance effectiveness with the topic
-
-#### Advanced Skills (3-4):
-Skills for senior/expert level
-
-#### Soft Skills (3-4):
-If requested, relevant soft skills
-
-For each skill provide:
-- name: Skill name
-- category: technical, soft, domain-specific
-- skill_type: hard, soft, hybrid
-- difficulty_to_learn: easy, medium, hard
-- time_to_learn: Typical learning time
-- description: What the skill involves
-- why_important: Why it matters for the topic
-- match_score: 0-100 relevance
-- related_to_topic: How it connects (2-3 points)
-- job_demand: low, medium, high, very high
-- salary_impact: low, medium, high
-- learning_resources: Where to learn (2-3 sources)
-- prerequisites: Skills needed first
-- icon: Emoji
-
-### TOOLS TO RECOMMEND:
-
-#### Essential Tools (4-6):
-Must-know tools for the topic
-
-#### Recommended Tools (3-5):
-Good to know, widely used
-
-#### Emerging Tools (2-3):
-New/trending tools gaining popularity
-
-For each tool provide:
-- name: Tool name
-- category: IDE, framework, library, platform, etc.
-- tool_type: software, library, framework, platform, service
-- description: What it does
-- why_use: Why use this tool
-- use_cases: Common use cases (3-4)
-- match_score: 0-100 relevance
-- related_to_topic: How it connects (2-3 points)
-- difficulty_to_learn: easy, medium, hard
-- time_to_learn: Time to become proficient
-- popularity: low, medium, high, industry-standard
-- alternatives: Alternative tools (2-3)
-- is_free: true/false
-- official_url: null (we won't include URLs)
-- icon: Emoji
-
-### ALSO PROVIDE:
-- recommended_stack: Recommended tech stack for the topic (5-8 items)
-- learning_order: Suggested order to learn skills/tools
-- industry_trends: Current trends in this area (4-5)
-- job_market_demand: Overall demand assessment
-
-## OUTPUT FORMAT:
-Return valid JSON:
-{{
-    "topic": "{topic}",
-    "user_profile_summary": "Summary of user context",
-    "core_skills": [
-        {{
-            "name": "Skill Name",
-            "category": "technical",
-            "skill_type": "hard",
-            "difficulty_to_learn": "medium",
-            "time_to_learn": "2-3 months",
-            "description": "Description",
-            "why_important": "Why it matters",
-            "match_score": 95,
-            "related_to_topic": ["Relation 1", "Relation 2"],
-            "job_demand": "very high",
-            "salary_impact": "high",
-            "learning_resources": ["Resource 1", "Resource 2"],
-            "prerequisites": ["Prerequisite 1"],
-            "icon": "💡"
-        }}
-    ],
-    "complementary_skills": [],
-    "advanced_skills": [],
-    "soft_skills": [],
-    "essential_tools": [
-        {{
-            "name": "Tool Name",
-            "category": "framework",
-            "tool_type": "library",
-            "description": "Description",
-            "why_use": "Why use it",
-            "use_cases": ["Use case 1"],
-            "match_score": 90,
-            "related_to_topic": ["Relation 1"],
-            "difficulty_to_learn": "medium",
-            "time_to_learn": "1-2 months",
-            "popularity": "industry-standard",
-            "alternatives": ["Alt 1", "Alt 2"],
-            "is_free": true,
-            "official_url": null,
-            "icon": "🔧"
-        }}
-    ],
-    "recommended_tools": [],
-    "emerging_tools": [],
-    "recommended_stack": ["Item 1", "Item 2"],
-    "learning_order": ["Learn X first", "Then Y"],
-    "industry_trends": ["Trend 1", "Trend 2"],
-    "job_market_demand": "high"
-}}
-
-Return ONLY valid JSON, no additional text.
+COURSE_RECOMMENDER_DYNAMIC = """## TOPIC REQUESTED:
+- Current Level: {current_level}
+- Prefer Certificates: {prefer_certificates}
+- Budget: {budget}
+- Time Available: {time_available}
+- Learning Goal: {learning_goal}
+- Topic: {topic}
+
+Recommend the best courses and certifications for this topic. Return ONLY valid JSON, no additional text.
 """
 
 
-PRACTICAL_PROJECT_RECOMMENDER_PROMPT = """You are an expert Project Builder Coach and GitHub Portfolio Specialist.
-Your MISSION: Convert learning topics into hands-on, portfolio-ready projects with professional GitHub structure.
-
-## Your Core Objectives:
-🎯 Prevent students from staying in theory mode
-🎯 Push them toward industry-style building
-🎯 Create employable portfolios with professional projects
-🎯 Teach real-world engineering practices
-
-## TOPIC REQUESTED:
-- **Topic**: {topic}
-- **Current Level**: {current_level}
-- **Time Available**: {time_available}
-- **Focus on Portfolio**: {focus_on_portfolio}
-
-## YOUR TASK:
-Generate practical, portfolio-ready project recommendations with complete GitHub guidance.
-
-### 1️⃣ PRACTICAL PROJECT RECOMMENDATIONS (Generate 3-6):
-
-**MUST INCLUDE:**
-- 1-2 Beginner Projects
-- 1-2 Intermediate Projects
-- 1-2 Advanced/Real-World Projects
-
-**For EACH project provide:**
-
-**A. Project Details:**
-- name: Clear, professional project name
-- level: beginner, intermediate, or advanced
-- description: Brief 1-2 sentence overview
-- what_you_will_build: Detailed 3-4 sentence explanation of deliverable
-- skills_gained: 4-6 specific skills learned
-- real_work_connection: 2-3 sentences on how this mirrors real industry work
-- cv_value: 2-3 sentences on why this is valuable for CV/portfolio
-- relevant_roles: 3-5 job roles that benefit from this project
-- tech_stack: 4-8 specific technologies/tools used
-- estimated_duration: Realistic time to complete
-- match_score: 0-100 relevance to topic
-
-**B. GitHub Repository Guidance (CRITICAL):**
-```json
-"github_guidance": {{
-    "repo_name": "professional-kebab-case-name",
-    "folder_structure": "Detailed folder structure with /paths",
-    "readme_should_contain": [
-        "Project Overview - What problem it solves",
-        "Key Features - Bullet list of capabilities",
-        "Tech Stack - Technologies used with versions",
-        "Architecture - System design diagram or explanation",
-        "Setup Instructions - Step-by-step installation",
-        "Usage Examples - How to use with code samples",
-        "API Documentation - If applicable",
-        "Screenshots/Demo - Visual proof it works",
-        "Testing - How to run tests",
-        "Deployment - How to deploy",
-        "Future Improvements - Roadmap",
-        "Contributing - If open source",
-        "License - If applicable"
-    ],
-    "professional_practices": [
-        "Write clear commit messages following conventional commits",
-        "Use feature branches (feature/*, bugfix/*, etc.)",
-        "Add comprehensive inline code documentation",
-        "Include .env.example for environment variables",
-        "Add proper .gitignore for the tech stack",
-        "Write meaningful PR descriptions",
-        "Include sample data or seed files",
-        "Add unit tests for core functionality",
-        "Use CI/CD if possible (GitHub Actions)",
-        "Add badges (build status, coverage, etc.)"
-    ],
-    "sample_commit_messages": [
-        "feat: Add user authentication with JWT",
-        "fix: Resolve database connection pooling issue",
-        "docs: Update API endpoint documentation",
-        "refactor: Extract validation logic into middleware",
-        "test: Add integration tests for payment flow"
-    ]
-}}
-```
-
-**Folder Structure Guidelines by Project Type:**
-
-**Backend/API:**
-```
-/src
-  /controllers
-  /models
-  /routes
-  /middleware
-  /services
-  /utils
-/tests
-/config
-/docs
-README.md
-.env.example
-.gitignore
-package.json or requirements.txt
-```
-
-**Frontend:**
-```
-/src
-  /components
-  /pages
-  /hooks
-  /services
-  /utils
-  /assets
-  /styles
-/public
-/tests
-README.md
-.env.example
-.gitignore
-package.json
-```
-
-**Full-Stack:**
-```
-/client
-  /src
-  /public
-/server
-  /src
-  /config
-/shared
-/docs
-README.md
-docker-compose.yml
-.gitignore
-```
-
-**Data Science/ML:**
-```
-/data
-  /raw
-  /processed
-/notebooks
-/src
-  /models
-  /features
-  /visualization
-/tests
-/models (saved models)
-/reports
-README.md
-requirements.txt
-.gitignore
-```
-
-### 2️⃣ YOUTUBE PROJECT PLAYLISTS (Generate 4-8):
-
-**🚫 CRITICAL REQUIREMENTS - DO NOT VIOLATE:**
-- Recommend ONLY playlists that BUILD REAL PROJECTS
-- NO lecture-only content
-- NO theory-heavy tutorials
-- Must be step-by-step BUILD tutorials
-- Focus on IMPLEMENTATION and hands-on coding
-
-**For EACH playlist provide:**
-```json
-{{
-    "title": "Exact playlist/video title",
-    "focus": "Specific project(s) built - be detailed",
-    "level": "beginner|intermediate|advanced",
-    "url": "https://youtube.com/playlist?list=... or /watch?v=...",
-    "channel": "Channel name",
-    "duration": "Total duration or video count",
-    "icon": "🎬"
-}}
-```
-
-**Include playlists for different levels:**
-- 2-3 Beginner-friendly project tutorials
-- 2-3 Intermediate project builds
-- 1-2 Advanced/production-level builds
-
-### 3️⃣ ADDITIONAL GUIDANCE:
-
-**why_build_projects:** 4-6 compelling reasons why building projects is critical:
-- Real-world application
-- Portfolio building
-- Interview talking points
-- Skill validation
-- Problem-solving experience
-- Employability boost
-
-**portfolio_tips:** 4-6 tips for showcasing projects:
-- How to present on GitHub
-- What to highlight in README
-- How to demo the project
-- What to mention in interviews
-- How to write about it on LinkedIn/CV
-
-**next_steps:** 3-5 immediate actions to take:
-- Which project to start with
-- Resources to review first
-- Timeline suggestions
-- How to track progress
-
-## IMPORTANT PRINCIPLES:
-
-1. **Realistic & Achievable**: Projects should be completable by students
-2. **Industry-Relevant**: Mirror real work scenarios
-3. **Portfolio-Ready**: Impressive enough for portfolios/interviews
-4. **Progressive Difficulty**: Build skills gradually
-5. **Professional Standards**: Teach industry best practices
-6. **Employability Focus**: Everything ties to getting hired
-
-## OUTPUT FORMAT:
-Return valid JSON:
-{{
-    "topic": "{topic}",
-    "topic_summary": "1-2 sentence summary of the topic and its importance",
-    "projects": [
-        {{
-            "name": "E-Commerce REST API",
-            "level": "intermediate",
-            "description": "Full-featured e-commerce backend API",
-            "what_you_will_build": "A production-ready RESTful API...",
-            "skills_gained": ["REST API design", "Authentication", "Database design"],
-            "real_work_connection": "E-commerce backends are...",
-            "cv_value": "Demonstrates ability to...",
-            "relevant_roles": ["Backend Developer", "Full-Stack Engineer"],
-            "tech_stack": ["Node.js", "Express", "MongoDB", "JWT"],
-            "estimated_duration": "3-4 weeks",
-            "github_guidance": {{ 
-                "repo_name": "ecommerce-rest-api",
-                "folder_structure": "/src\\n  /controllers\\n  /models\\n  /routes\\nREADME.md",
-                "readme_should_contain": ["Project Overview", "Setup Instructions"],
-                "professional_practices": ["Clear commit messages", "Feature branches"],
-                "sample_commit_messages": ["feat: Add user auth", "fix: Database connection"]
-            }},
-            "match_score": 90,
-            "icon": "💼"
-        }}
-    ],
-    "youtube_project_playlists": [
-        {{
-            "title": "Build a Full-Stack MERN E-Commerce App",
-            "focus": "Complete e-commerce platform with cart, payments, and admin panel",
-            "level": "intermediate",
-            "url": "https://youtube.com/playlist?list=EXAMPLE",
-            "channel": "Traversy Media",
-            "duration": "12 hours / 25 videos",
-            "icon": "🎬"
-        }}
-    ],
-    "why_build_projects": [
-        "Practical application of theoretical knowledge",
-        "Builds a portfolio that employers actually review",
-        "Provides concrete examples for technical interviews"
-    ],
-    "portfolio_tips": [
-        "Add a 'Live Demo' link in your README",
-        "Include GIFs showing key features",
-        "Write about challenges you solved"
-    ],
-    "next_steps": [
-        "Start with the beginner project to build confidence",
-        "Set up GitHub repository with proper structure",
-        "Commit code daily to build consistency"
-    ]
-}}
+SKILLS_TOOLS_RECOMMENDER_DYNAMIC = """## TOPIC REQUESTED:
+- Experience Level: {experience_level}
+- Include Soft Skills: {include_soft_skills}
+- Focus Area: {focus_area}
+- Career Goal: {career_goal}
+- Topic: {topic}
+- Current Skills: {current_skills}
 
-Return ONLY valid JSON, no additional text.
+Recommend the most relevant skills and tools for this topic. Return ONLY valid JSON, no additional text.
 """
+
+
+PRACTICAL_PROJECT_RECOMMENDER_DYNAMIC = """## TOPIC REQUESTED:
+- Current Level: {current_level}
+- Focus on Portfolio: {focus_on_portfolio}
+- Time Available: {time_available}
+- Topic: {topic}
+
+Generate practical project recommendations for this topic. Return ONLY valid JSON, no additional text.
+"""
+
+
+# ============================================
+# Static prompts (loaded from prompt_templates/)
+# ============================================
+
+_TEMPLATES_DIR = Path(__file__).parent / "prompt_templates"
+_INCLUDE_RE = re.compile(r"<<include:(\w+)>>")
+_LOCATION_CASE_RE = re.compile(r'^- If "(\w+)": (.*)\n', re.MULTILINE)
+_BOLD_RE = re.compile(r"\*\*(.+?)\*\*")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+
+def _minify(text: str) -> str:
+    """Drop formatting that costs tokens without changing the instructions."""
+    if settings.debug_verbose_prompts:
+        return text
+    text = _BOLD_RE.sub(r"\1", text)
+    text = "\n".join(line.rstrip() for line in text.split("\n"))
+    return _BLANK_LINES_RE.sub("\n\n", text)
+
+
+@functools.cache
+def _load(name: str) -> str:
+    """Read a template file through a read-only memory map."""
+    path = _TEMPLATES_DIR / f"{name}.txt"
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm[:].decode("utf-8")
+
+
+def _expand_includes(text: str) -> str:
+    """Replace ``<<include:name>>`` markers with the named snippet file."""
+    return _INCLUDE_RE.sub(lambda m: _expand_includes(_load(m.group(1)).rstrip("\n")), text)
+
+
+def _specialize_location(text: str, location_preference: Optional[str]) -> str:
+    """
+    Keep only the ``- If "<location>": ...`` bullets that apply to this request.
+    
+    The caller already knows the location, so the model does not need to read
+    the other branches. Unconditional bullets are always kept.
+    """
+    if not location_preference:
+        return text
+    location = str(location_preference).lower()
+
+    def keep_matching(match: re.Match) -> str:
+        return f"- {match.group(2)}\n" if match.group(1) == location else ""
+
+    return _LOCATION_CASE_RE.sub(keep_matching, text)
+
+
+@functools.cache
+def get_static_prompt(kind: str, location_preference: Optional[str] = None) -> str:
+    """
+    Return the minified static prompt for a recommender kind.
+    
+    Args:
+        kind: "internship", "event", "course", "skills_tools" or "project"
+        location_preference: Specialize the location bullets for this location
+            ("egypt", "abroad", "remote", "hybrid"). If None, keeps all of them
+    """
+    if kind not in RECOMMENDER_KINDS:
+        raise ValueError(f"Unknown recommender prompt: {kind}. Supported: {list(RECOMMENDER_KINDS)}")
+    text = _specialize_location(_expand_includes(_load(kind)), location_preference)
+    return _minify(text)
+
+
+def reload_prompts() -> None:
+    """Drop loaded templates so edited files are picked up without a restart."""
+    _load.cache_clear()
+    get_static_prompt.cache_clear()
+    _prefix_ids.cache_clear()
+
+
+_STATIC_CONSTANTS = {
+    "INTERNSHIP_RECOMMENDER_STATIC": "internship",
+    "EVENT_RECOMMENDER_STATIC": "event",
+    "COURSE_RECOMMENDER_STATIC": "course",
+    "SKILLS_TOOLS_RECOMMENDER_STATIC": "skills_tools",
+    "PRACTICAL_PROJECT_RECOMMENDER_STATIC": "project",
+}
+
+
+def __getattr__(name: str) -> str:
+    """Resolve the ``*_STATIC`` constants lazily on first access (PEP 562)."""
+    if name in _STATIC_CONSTANTS:
+        return get_static_prompt(_STATIC_CONSTANTS[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# ============================================
+# Renderers
+# ============================================
+
+class _DefaultMapping(dict):
+    """Mapping that renders missing template fields as "N/A"."""
+
+    def __missing__(self, key: str) -> str:
+        return "N/A"
+
+
+def render_internship_prompt(**kwargs: Any) -> str:
+    """Render the dynamic internship prompt tail."""
+    return INTERNSHIP_RECOMMENDER_DYNAMIC.format_map(_DefaultMapping(kwargs))
+
+
+def render_event_prompt(**kwargs: Any) -> str:
+    """Render the dynamic event prompt tail."""
+    return EVENT_RECOMMENDER_DYNAMIC.format_map(_DefaultMapping(kwargs))
+
+
+def render_course_prompt(**kwargs: Any) -> str:
+    """Render the dynamic course prompt tail."""
+    return COURSE_RECOMMENDER_DYNAMIC.format_map(_DefaultMapping(kwargs))
+
+
+def render_skills_tools_prompt(**kwargs: Any) -> str:
+    """Render the dynamic skills/tools prompt tail."""
+    return SKILLS_TOOLS_RECOMMENDER_DYNAMIC.format_map(_DefaultMapping(kwargs))
+
+
+def render_project_prompt(**kwargs: Any) -> str:
+    """Render the dynamic practical project prompt tail."""
+    return PRACTICAL_PROJECT_RECOMMENDER_DYNAMIC.format_map(_DefaultMapping(kwargs))
+
+
+# ============================================
+# Registry by recommender kind
+# ============================================
+
+RECOMMENDER_RENDERERS: Dict[str, Callable[..., str]] = {
+    "internship": render_internship_prompt,
+    "event": render_event_prompt,
+    "course": render_course_prompt,
+    "skills_tools": render_skills_tools_prompt,
+    "project": render_project_prompt,
+}
+
+
+# ============================================
+# Structured output schemas by recommender kind
+# ============================================
+
+RECOMMENDER_OUTPUT_MODELS: Dict[str, Type[BaseModel]] = {
+    "internship": InternshipRecommendation,
+    "event": EventRecommendation,
+    "course": CourseRecommendation,
+    "skills_tools": SkillsToolsRecommendation,
+    "project": PracticalProjectResponse,
+}
+
+
+@functools.cache
+def get_output_schema(kind: str) -> Dict[str, Any]:
+    """
+    Return the JSON schema the recommender's response must follow.
+    
+    The schema is shared between calls; do not mutate it.
+    """
+    if kind not in RECOMMENDER_OUTPUT_MODELS:
+        raise ValueError(f"Unknown recommender prompt: {kind}. Supported: {list(RECOMMENDER_KINDS)}")
+    return RECOMMENDER_OUTPUT_MODELS[kind].model_json_schema()
+
+
+# ============================================
+# Structured message assembly
+# ============================================
+
+def build_recommender_messages(
+    kind: str,
+    cache_control: bool = False,
+    **kwargs: Any,
+) -> List[Dict[str, Any]]:
+    """
+    Build provider-agnostic chat messages for a recommender prompt.
+    
+    Args:
+        kind: Recommender kind
+        cache_control: Emit the system prompt as a text block tagged with an
+            Anthropic ``cache_control`` breakpoint. Only the Anthropic batch
+            runner sends these
+        **kwargs: Template variables for the dynamic tail
+        
+    Returns:
+        List of {"role", "content"} message dicts
+    """
+    static = get_static_prompt(kind, kwargs.get("location_preference"))
+    if cache_control:
+        system_content: Any = [
+            {"type": "text", "text": static, "cache_control": {"type": "ephemeral"}}
+        ]
+    else:
+        system_content = static
+
+    return [
+        {"role": "system", "content": system_content},
+        {"role": "user", "content": RECOMMENDER_RENDERERS[kind](**kwargs)},
+    ]
+
+
+def build_course_messages(**kwargs: Any) -> List[Dict[str, Any]]:
+    """Build the chat messages for the course recommender."""
+    return build_recommender_messages("course", **kwargs)
+
+
+def build_skills_tools_messages(**kwargs: Any) -> List[Dict[str, Any]]:
+    """Build the chat messages for the skills/tools recommender."""
+    return build_recommender_messages("skills_tools", **kwargs)
+
+
+# ============================================
+# Token-level prompt assembly
+# ============================================
+
+DEFAULT_TOKENIZER_MODEL = "gpt-4o"
+
+
+@functools.cache
+def _get_encoding(model: str = DEFAULT_TOKENIZER_MODEL) -> Any:
+    """Lazy load the tiktoken encoding for a model."""
+    try:
+        import tiktoken
+    except ImportError:
+        raise ImportError(
+            "tiktoken package is required for token-level prompts. "
+            "Install it with: pip install tiktoken"
+        )
+    return tiktoken.encoding_for_model(model)
+
+
+@functools.cache
+def _prefix_ids(kind: str, location_preference: Optional[str] = None) -> Tuple[int, ...]:
+    """Token ids of the static prompt, encoded once per (kind, location)."""
+    return tuple(_get_encoding().encode(get_static_prompt(kind, location_preference)))
+
+
+def prompt_token_ids(kind: str, **kwargs: Any) -> List[int]:
+    """
+    Return the full recommender prompt (static prefix + dynamic tail) as token ids.
+    
+    Only the short dynamic tail is tokenized per call; the static prefix ids
+    are cached. The two parts are concatenated as plain text with no chat
+    template or role markers, so this is only for raw-completion models that
+    take token-id prompts (e.g. a base model on a local vLLM or llama.cpp
+    server). Chat-tuned models should get build_recommender_messages() instead.
+    Nothing in the app calls this yet.
+    
+    Args:
+        kind: Recommender kind
+        **kwargs: Template variables for the dynamic tail
+        
+    Returns:
+        Token ids for the ``gpt-4o`` encoding
+    """
+    prefix = _prefix_ids(kind, kwargs.get("location_preference"))
+    return [*prefix, *_get_encoding().encode(RECOMMENDER_RENDERERS[kind](**kwargs))]
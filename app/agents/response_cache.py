@@ -0,0 +1,125 @@
+"""Response Cache - Exact-match LRU cache for recommender responses.
+
+Requests whose prompt variables are identical after normalization get the
+same response without an embedding or LLM call. It sits in front of the
+semantic cache: a plain dict lookup, checked first.
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from app.config import settings
+
+CacheKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+def _norm_key(variables: Dict[str, Any]) -> Tuple[Tuple[str, str], ...]:
+    """Normalize prompt variables into a hashable, order-independent key."""
+    return tuple(sorted((key, str(value).strip().lower()) for key, value in variables.items()))
+
+
+class ResponseCache:
+    """
+    LRU cache keyed by (prompt_name, normalized prompt variables).
+
+    Features:
+    - Bounded size with least-recently-used eviction
+    - Entry TTL (expired entries are dropped on access)
+    - Per-prompt invalidation
+    - Single-flight: concurrent identical async requests wait for the first one
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl_seconds: Optional[float] = 86400):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of cached responses
+            ttl_seconds: Entry lifetime in seconds (None = never expires)
+        """
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[CacheKey, Tuple[str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._inflight: Dict[CacheKey, List[Any]] = {}  # key -> [asyncio.Lock, users]
+
+    def get(self, prompt_name: str, variables: Dict[str, Any]) -> Optional[str]:
+        """Return the cached response for these exact variables, if any."""
+        key = (prompt_name, _norm_key(variables))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            response, created_at = entry
+            if self.ttl_seconds is not None and time.time() - created_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return response
+
+    def put(self, prompt_name: str, variables: Dict[str, Any], response: str) -> None:
+        """Store a response, evicting the least recently used entry when full."""
+        if self.maxsize <= 0 or not response:
+            return
+        key = (prompt_name, _norm_key(variables))
+        with self._lock:
+            self._entries[key] = (response, time.time())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, prompt_name: Optional[str] = None) -> None:
+        """Drop cached responses for one prompt, or all prompts."""
+        with self._lock:
+            if prompt_name is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[0] == prompt_name]:
+                del self._entries[key]
+
+    @asynccontextmanager
+    async def single_flight(self, prompt_name: str, variables: Dict[str, Any]) -> AsyncIterator[None]:
+        """Serialize concurrent requests for the same key so only one calls the LLM."""
+        key = (prompt_name, _norm_key(variables))
+        entry = self._inflight.get(key)
+        if entry is None:
+            entry = self._inflight[key] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self._inflight[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Singleton instance
+_response_cache_instance: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Get the ResponseCache singleton, or None when the cache is disabled."""
+    global _response_cache_instance
+    if settings.response_cache_size <= 0:
+        return None
+    if _response_cache_instance is None:
+        _response_cache_instance = ResponseCache(
+            maxsize=settings.response_cache_size,
+            ttl_seconds=settings.response_cache_ttl_seconds,
+        )
+    return _response_cache_instance
+
+
+def invalidate(kind: Optional[str] = None) -> None:
+    """Drop exact-match cached responses for one recommender kind, or all kinds."""
+    if _response_cache_instance is not None:
+        _response_cache_instance.invalidate(kind)
@@ -0,0 +1,451 @@
+"""Semantic Cache - Reuses recommender responses for near-identical prompt variables.
+
+Requests are bucketed by prompt name plus their discrete fields (location,
+level, flags, ...), which must match exactly. Within a bucket only the
+free-text fields are embedded, and a cached response is returned when the
+cosine similarity to a previous request is above the configured threshold.
+The ``cached_generate`` helpers check the exact-match response cache first.
+"""
+from __future__ import annotations
+
+import bisect
+import json
+import logging
+import math
+import os
+import pickle
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.agents.response_cache import get_response_cache
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+try:
+    import faiss
+    import numpy as np
+except ImportError:  # Optional: falls back to a pure Python scan
+    faiss = None
+    np = None
+
+
+DEFAULT_EMBEDDING_MODEL = "text-embedding-3-small"
+
+# Enumerated/boolean prompt variables per prompt. They select a bucket instead
+# of being embedded, so e.g. a "remote" request never reuses an "egypt" answer.
+DISCRETE_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "internship": ("academic_year", "location_preference"),
+    "event": ("academic_year", "location_preference", "event_types", "timeframe", "include_online"),
+    "course": ("current_level", "time_available", "budget", "prefer_certificates"),
+    "skills_tools": ("experience_level", "include_soft_skills"),
+    "project": ("current_level", "time_available", "focus_on_portfolio"),
+}
+
+BucketKey = Tuple[str, str]
+
+
+@dataclass
+class _Bucket:
+    """Cached entries for a single prompt."""
+    vectors: List[List[float]] = field(default_factory=list)
+    responses: List[str] = field(default_factory=list)
+    created_at: List[float] = field(default_factory=list)
+    index: Any = None  # faiss.IndexFlatIP, rebuilt on load
+
+
+def _normalize(vector: List[float]) -> List[float]:
+    norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+    return [v / norm for v in vector]
+
+
+def _bucket_key(prompt_name: str, variables: Dict[str, Any]) -> BucketKey:
+    """Return (prompt_name, "value|value|...") built from the discrete fields."""
+    fields = DISCRETE_FIELDS.get(prompt_name, ())
+    return prompt_name, "|".join(str(variables.get(key)).strip().lower() for key in fields)
+
+
+def _embedding_text(prompt_name: str, variables: Dict[str, Any]) -> str:
+    """Concatenate the free-text variable values in a stable key order."""
+    discrete = DISCRETE_FIELDS.get(prompt_name, ())
+    return "\n".join(
+        f"{key}: {variables[key]}" for key in sorted(variables) if key not in discrete
+    )
+
+
+def _is_json_object(response: Optional[str]) -> bool:
+    """Whether a raw response holds a JSON object (optionally in a code fence)."""
+    if not response:
+        return False
+    json_match = re.search(r'```(?:json)?\s*([\s\S]*?)\s*```', response)
+    try:
+        return isinstance(json.loads(json_match.group(1) if json_match else response), dict)
+    except json.JSONDecodeError:
+        return False
+
+
+class SemanticCache:
+    """
+    Embedding-based response cache keyed by (prompt_name, prompt variables).
+
+    Features:
+    - Exact match on discrete fields, cosine similarity on free-text fields
+      (FAISS if installed)
+    - Per-prompt similarity threshold and TTL
+    - Expired entries pruned on access; bucket size capped, oldest dropped first
+    - Optional pickle persistence, written every ``persist_every`` puts
+    """
+
+    def __init__(
+        self,
+        embeddings: Any = None,
+        threshold: float = 0.93,
+        ttl_seconds: Optional[float] = 86400,
+        thresholds: Optional[Dict[str, float]] = None,
+        ttls: Optional[Dict[str, Optional[float]]] = None,
+        persist_path: Optional[str] = None,
+        persist_every: int = 20,
+        max_entries: int = 1000,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            embeddings: LangChain Embeddings instance. If None, uses OpenAI embeddings
+            threshold: Default cosine-similarity threshold for a hit
+            ttl_seconds: Default entry lifetime in seconds (None = never expires)
+            thresholds: Per-prompt threshold overrides
+            ttls: Per-prompt TTL overrides
+            persist_path: Pickle file to load from and persist to
+            persist_every: Persist after this many puts
+            max_entries: Maximum entries per bucket
+        """
+        self._embeddings = embeddings
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.thresholds = thresholds or {}
+        self.ttls = ttls or {}
+        self.persist_path = persist_path
+        self.persist_every = persist_every
+        self.max_entries = max_entries
+        self._buckets: Dict[BucketKey, _Bucket] = {}
+        self._lock = threading.Lock()
+        self._puts_since_persist = 0
+
+        if persist_path and os.path.exists(persist_path):
+            self.load()
+
+    @property
+    def embeddings(self) -> Any:
+        """Lazy load the embeddings client."""
+        if self._embeddings is None:
+            from langchain_openai import OpenAIEmbeddings
+            self._embeddings = OpenAIEmbeddings(
+                model=DEFAULT_EMBEDDING_MODEL,
+                api_key=settings.openai_api_key,
+            )
+        return self._embeddings
+
+    # ---------- lookup ----------
+
+    def embed(self, prompt_name: str, variables: Dict[str, Any]) -> List[float]:
+        """Embed the free-text prompt variables into a normalized vector."""
+        text = _embedding_text(prompt_name, variables)
+        return _normalize(self.embeddings.embed_query(text))
+
+    async def aembed(self, prompt_name: str, variables: Dict[str, Any]) -> List[float]:
+        """Async version of embed."""
+        text = _embedding_text(prompt_name, variables)
+        return _normalize(await self.embeddings.aembed_query(text))
+
+    def get(self, prompt_name: str, variables: Dict[str, Any]) -> Optional[str]:
+        """Return a cached response for similar variables, if any."""
+        return self.lookup(prompt_name, variables, self.embed(prompt_name, variables))
+
+    async def aget(self, prompt_name: str, variables: Dict[str, Any]) -> Optional[str]:
+        """Async version of get."""
+        return self.lookup(prompt_name, variables, await self.aembed(prompt_name, variables))
+
+    def put(self, prompt_name: str, variables: Dict[str, Any], response: str) -> None:
+        """Store a response for the given variables."""
+        self.store(prompt_name, variables, self.embed(prompt_name, variables), response)
+
+    async def aput(self, prompt_name: str, variables: Dict[str, Any], response: str) -> None:
+        """Async version of put."""
+        self.store(prompt_name, variables, await self.aembed(prompt_name, variables), response)
+
+    def lookup(
+        self,
+        prompt_name: str,
+        variables: Dict[str, Any],
+        vector: List[float],
+    ) -> Optional[str]:
+        """Return the best response above the prompt's threshold in the variables' bucket."""
+        threshold = self.thresholds.get(prompt_name, self.threshold)
+
+        with self._lock:
+            bucket = self._buckets.get(_bucket_key(prompt_name, variables))
+            if bucket is None:
+                return None
+            self._prune(bucket, self.ttls.get(prompt_name, self.ttl_seconds))
+
+            match = self._search(bucket, vector)
+            if match is None or match[0] < threshold:
+                return None
+            score, idx = match
+            logger.info(f"Semantic cache hit for {prompt_name} (similarity {score:.3f})")
+            return bucket.responses[idx]
+
+    def _search(self, bucket: _Bucket, vector: List[float]) -> Optional[Tuple[float, int]]:
+        """Return (similarity, index) of the most similar entry, if any."""
+        if not bucket.vectors:
+            return None
+        if bucket.index is not None:
+            scores, ids = bucket.index.search(np.asarray([vector], dtype="float32"), 1)
+            return float(scores[0][0]), int(ids[0][0])
+
+        return max(
+            (sum(a * b for a, b in zip(vector, other)), idx)
+            for idx, other in enumerate(bucket.vectors)
+        )
+
+    def _prune(self, bucket: _Bucket, ttl: Optional[float], reserve: int = 0) -> None:
+        """
+        Drop expired entries, and the oldest entries beyond ``max_entries``.
+
+        Entries are appended in creation order, so both are a prefix of the
+        bucket. Must be called with the lock held.
+        """
+        drop = 0
+        if ttl is not None:
+            drop = bisect.bisect_left(bucket.created_at, time.time() - ttl)
+        drop = max(drop, len(bucket.vectors) + reserve - self.max_entries)
+        if drop <= 0:
+            return
+
+        del bucket.vectors[:drop]
+        del bucket.responses[:drop]
+        del bucket.created_at[:drop]
+        bucket.index = self._build_index(bucket.vectors)
+
+    @staticmethod
+    def _build_index(vectors: List[List[float]]) -> Any:
+        """Build a FAISS index over the vectors, or None without FAISS."""
+        if faiss is None or not vectors:
+            return None
+        index = faiss.IndexFlatIP(len(vectors[0]))
+        index.add(np.asarray(vectors, dtype="float32"))
+        return index
+
+    # ---------- storage ----------
+
+    def store(
+        self,
+        prompt_name: str,
+        variables: Dict[str, Any],
+        vector: List[float],
+        response: str,
+    ) -> None:
+        """Store a response under an already embedded vector."""
+        with self._lock:
+            bucket = self._buckets.setdefault(_bucket_key(prompt_name, variables), _Bucket())
+            self._prune(bucket, self.ttls.get(prompt_name, self.ttl_seconds), reserve=1)
+            bucket.vectors.append(vector)
+            bucket.responses.append(response)
+            bucket.created_at.append(time.time())
+            if faiss is not None:
+                if bucket.index is None:
+                    bucket.index = faiss.IndexFlatIP(len(vector))
+                bucket.index.add(np.asarray([vector], dtype="float32"))
+
+            self._puts_since_persist += 1
+            should_persist = (
+                self.persist_path is not None
+                and self._puts_since_persist >= self.persist_every
+            )
+
+        if should_persist:
+            self.save()
+
+    def save(self) -> None:
+        """Persist cached entries to ``persist_path``."""
+        if not self.persist_path:
+            return
+        with self._lock:
+            data = {
+                key: {
+                    "vectors": list(bucket.vectors),
+                    "responses": list(bucket.responses),
+                    "created_at": list(bucket.created_at),
+                }
+                for key, bucket in self._buckets.items()
+            }
+            self._puts_since_persist = 0
+
+        directory = os.path.dirname(self.persist_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.persist_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(data, f)
+        os.replace(tmp_path, self.persist_path)
+
+    def load(self) -> None:
+        """Load cached entries from ``persist_path``."""
+        try:
+            with open(self.persist_path, "rb") as f:
+                data = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Could not load semantic cache from {self.persist_path}: {e}")
+            return
+
+        with self._lock:
+            self._buckets = {}
+            for key, entry in data.items():
+                if not isinstance(key, tuple):
+                    continue  # Written before buckets were keyed by discrete fields
+                self._buckets[key] = _Bucket(
+                    vectors=entry["vectors"],
+                    responses=entry["responses"],
+                    created_at=entry["created_at"],
+                    index=self._build_index(entry["vectors"]),
+                )
+
+    def clear(self, prompt_name: Optional[str] = None) -> None:
+        """Drop cached entries for one prompt, or all prompts."""
+        with self._lock:
+            if prompt_name is None:
+                self._buckets.clear()
+                return
+            for key in [key for key in self._buckets if key[0] == prompt_name]:
+                del self._buckets[key]
+
+
+# Singleton instance
+_semantic_cache_instance: Optional[SemanticCache] = None
+
+
+def get_semantic_cache() -> Optional[SemanticCache]:
+    """Get the SemanticCache singleton, or None when the cache is disabled."""
+    global _semantic_cache_instance
+    if not settings.semantic_cache_enabled or not settings.openai_api_key:
+        return None
+    if _semantic_cache_instance is None:
+        _semantic_cache_instance = SemanticCache(
+            threshold=settings.semantic_cache_threshold,
+            ttl_seconds=settings.semantic_cache_ttl_seconds,
+            persist_path=settings.semantic_cache_path,
+        )
+    return _semantic_cache_instance
+
+
+def _semantic_generate(
+    prompt_name: str,
+    variables: Dict[str, Any],
+    generate: Callable[[], str],
+) -> str:
+    """Return a semantically cached response or call ``generate`` and cache it."""
+    cache = get_semantic_cache()
+    if cache is None:
+        return generate()
+
+    try:
+        vector = cache.embed(prompt_name, variables)
+    except Exception as e:
+        logger.warning(f"Semantic cache lookup failed for {prompt_name}: {e}")
+        return generate()
+    cached = cache.lookup(prompt_name, variables, vector)
+    if cached is not None:
+        return cached
+
+    response = generate()
+    if not _is_json_object(response):
+        return response
+    try:
+        cache.store(prompt_name, variables, vector, response)
+    except Exception as e:
+        logger.warning(f"Semantic cache store failed for {prompt_name}: {e}")
+    return response
+
+
+async def _asemantic_generate(
+    prompt_name: str,
+    variables: Dict[str, Any],
+    generate: Callable[[], Awaitable[str]],
+) -> str:
+    """Async version of _semantic_generate."""
+    cache = get_semantic_cache()
+    if cache is None:
+        return await generate()
+
+    try:
+        vector = await cache.aembed(prompt_name, variables)
+    except Exception as e:
+        logger.warning(f"Semantic cache lookup failed for {prompt_name}: {e}")
+        return await generate()
+    cached = cache.lookup(prompt_name, variables, vector)
+    if cached is not None:
+        return cached
+
+    response = await generate()
+    if not _is_json_object(response):
+        return response
+    try:
+        cache.store(prompt_name, variables, vector, response)
+    except Exception as e:
+        logger.warning(f"Semantic cache store failed for {prompt_name}: {e}")
+    return response
+
+
+def cached_generate(
+    prompt_name: str,
+    variables: Dict[str, Any],
+    generate: Callable[[], str],
+) -> str:
+    """
+    Return a cached response for ``variables`` or call ``generate`` and cache it.
+    
+    The exact-match response cache is checked first, then the semantic cache.
+    """
+    exact = get_response_cache()
+    if exact is not None:
+        cached = exact.get(prompt_name, variables)
+        if cached is not None:
+            return cached
+
+    response = _semantic_generate(prompt_name, variables, generate)
+    if exact is not None and _is_json_object(response):
+        exact.put(prompt_name, variables, response)
+    return response
+
+
+async def acached_generate(
+    prompt_name: str,
+    variables: Dict[str, Any],
+    generate: Callable[[], Awaitable[str]],
+) -> str:
+    """
+    Async version of cached_generate.
+    
+    Concurrent calls with the same variables are coalesced: the first one
+    generates the response and the others are served from the cache.
+    """
+    exact = get_response_cache()
+    if exact is None:
+        return await _asemantic_generate(prompt_name, variables, generate)
+
+    cached = exact.get(prompt_name, variables)
+    if cached is not None:
+        return cached
+
+    async with exact.single_flight(prompt_name, variables):
+        cached = exact.get(prompt_name, variables)
+        if cached is not None:
+            return cached
+        response = await _asemantic_generate(prompt_name, variables, generate)
+        if _is_json_object(response):
+            exact.put(prompt_name, variables, response)
+        return response
@@ -16,6 +16,7 @@ class Settings:
     openai_api_key: str | None
     gemini_api_key: str | None
     groq_api_key: str | None
+    anthropic_api_key: str | None
     
     # Other API keys
     search_api_key: str | None
@@ -25,6 +26,19 @@ class Settings:
     search_provider: str
     max_results: int
     top_k: int
+    
+    # Semantic response cache for recommender prompts
+    semantic_cache_enabled: bool
+    semantic_cache_threshold: float
+    semantic_cache_ttl_seconds: int
+    semantic_cache_path: str | None
+    
+    # Exact-match response cache for recommender prompts (size 0 disables it)
+    response_cache_size: int
+    response_cache_ttl_seconds: int
+    
+    # Skip prompt minification (keeps prompts readable while developing)
+    debug_verbose_prompts: bool
 
 
 def _load_settings() -> Settings:
@@ -37,6 +51,7 @@ def _load_settings() -> Settings:
         openai_api_key=os.getenv("OPENAI_API_KEY"),
         gemini_api_key=os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY"),
         groq_api_key=os.getenv("GROQ_API_KEY"),
+        anthropic_api_key=os.getenv("ANTHROPIC_API_KEY"),
         
         # Other settings
         search_api_key=os.getenv("SEARCH_API_KEY"),
@@ -44,6 +59,16 @@ def _load_settings() -> Settings:
         search_provider=os.getenv("SEARCH_PROVIDER", "mock"),
         max_results=int(os.getenv("MAX_RESULTS", "20")),
         top_k=int(os.getenv("TOP_K", "5")),
+        
+        # Semantic cache settings
+        semantic_cache_enabled=os.getenv("SEMANTIC_CACHE_ENABLED", "false").lower() == "true",
+        semantic_cache_threshold=float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.93")),
+        semantic_cache_ttl_seconds=int(os.getenv("SEMANTIC_CACHE_TTL_SECONDS", "86400")),
+        semantic_cache_path=os.getenv("SEMANTIC_CACHE_PATH"),
+        response_cache_size=int(os.getenv("RESPONSE_CACHE_SIZE", "0")),
+        response_cache_ttl_seconds=int(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "86400")),
+        
+        debug_verbose_prompts=os.getenv("DEBUG_VERBOSE_PROMPTS", "false").lower() == "true",
     )
 
 
@@ -0,0 +1,48 @@
+"""Compare recommender prompt token counts before and after minification."""
+import sys
+
+from app.agents.recommender_prompts import (
+    DEFAULT_TOKENIZER_MODEL,
+    RECOMMENDER_KINDS,
+    RECOMMENDER_RENDERERS,
+    _expand_includes,
+    _get_encoding,
+    _load,
+    get_static_prompt,
+)
+
+# Location used for the kinds whose static prompt is specialized per location
+SAMPLE_LOCATION = {"internship": "egypt", "event": "egypt"}
+
+
+def count_tokens(text: str) -> int:
+    """Count tokens with the tokenizer used for token-level prompts."""
+    return len(_get_encoding().encode(text))
+
+
+def check_prompt_tokens() -> bool:
+    """Print raw vs sent token counts per kind; False if any prompt grew."""
+    print(f"Tokenizer: {DEFAULT_TOKENIZER_MODEL}\n")
+    print(f"{'kind':<14}{'raw':>8}{'sent':>8}{'saved':>9}")
+
+    ok = True
+    total_raw = total_sent = 0
+    for kind in RECOMMENDER_KINDS:
+        location = SAMPLE_LOCATION.get(kind)
+        tail = RECOMMENDER_RENDERERS[kind](location_preference=location)
+
+        # Template file as written vs what build_recommender_messages() sends
+        raw = count_tokens(_expand_includes(_load(kind)) + tail)
+        sent = count_tokens(get_static_prompt(kind, location) + tail)
+
+        total_raw += raw
+        total_sent += sent
+        ok = ok and sent <= raw
+        print(f"{kind:<14}{raw:>8}{sent:>8}{1 - sent / raw:>9.1%}")
+
+    print(f"{'total':<14}{total_raw:>8}{total_sent:>8}{1 - total_sent / total_raw:>9.1%}")
+    return ok
+
+
+if __name__ == "__main__":
+    sys.exit(0 if check_prompt_tokens() else 1)